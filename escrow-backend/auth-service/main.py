@@ -1,15 +1,13 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import create_engine, Column, String, Integer, Boolean
+from sqlalchemy import Column, String, Integer, Boolean
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from shared.db import LazyDatabase
 import random
 import uuid
 
 # --- Database Setup (cite: 1095) ---
 DATABASE_URL = "sqlite:///./users.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 class User(Base):
@@ -20,7 +18,8 @@ class User(Base):
     otp_code = Column(String, nullable=True)
     is_verified = Column(Boolean, default=False)
 
-Base.metadata.create_all(bind=engine)
+# Engine and schema are created on the first session, not at import.
+SessionLocal = LazyDatabase(DATABASE_URL, Base)
 
 app = FastAPI(title="BlueMint - Complete Auth & Integrity Service")
 
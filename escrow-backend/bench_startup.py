@@ -0,0 +1,155 @@
+"""
+Compares the eight-process deployment against run_all.py.
+
+Measures cold-start time (launch until every port accepts connections),
+total RSS once idle, and latency of the Gateway's internal hops:
+
+    python bench_startup.py [--requests 200]
+
+The eight-process baseline runs without --reload, which would add a file
+watcher process per service. Services run in a scratch directory so the
+real *.db files are untouched.
+RSS uses psutil when installed, otherwise /proc (Linux).
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BACKEND_DIR)
+
+from run_all import SERVICES, LEGACY_PORTS  # noqa: E402
+from shared.service_client import ServiceSession, clear_local, register_local  # noqa: E402
+
+INTEGRITY_OK = {
+    "device_id": "BENCH-DEVICE",
+    "is_rooted": False,
+    "app_signature_valid": True,
+    "has_debugger": False,
+    "is_emulator": False,
+}
+
+
+def rss_mb(pid: int) -> float:
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / 2**20
+    except ImportError:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def wait_for_ports(ports, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    pending = set(ports)
+    while pending:
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Ports never came up: {sorted(pending)}")
+        for port in list(pending):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                pending.discard(port)
+            except OSError:
+                pass
+        time.sleep(0.01)
+
+
+def launch(commands, workdir, ports=LEGACY_PORTS):
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR)
+    start = time.perf_counter()
+    procs = [
+        subprocess.Popen(cmd, cwd=workdir, env=env,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for cmd in commands
+    ]
+    wait_for_ports(ports)
+    return procs, time.perf_counter() - start
+
+
+def stop(procs):
+    for p in procs:
+        p.terminate()
+    for p in procs:
+        p.wait()
+
+
+async def time_gateway(n: int) -> float:
+    """Mean ms per /gateway/prepare-offline call (3 internal hops each)."""
+    payload = {"wallet_id": "WLT-BENCH", "phone": "0", "amount": 100.0,
+               "integrity_report": INTEGRITY_OK}
+    async with httpx.AsyncClient() as client:
+        await client.post("http://127.0.0.1:8080/gateway/prepare-offline", json=payload)
+        start = time.perf_counter()
+        for _ in range(n):
+            await client.post("http://127.0.0.1:8080/gateway/prepare-offline", json=payload)
+    return (time.perf_counter() - start) * 1000 / n
+
+
+async def time_hop(n: int) -> float:
+    """Mean ms for one Gateway -> Auth hop, as the Gateway issues it."""
+    start = time.perf_counter()
+    for _ in range(n):
+        async with ServiceSession() as services:
+            await services.post_json("http://localhost:8000", "/auth/verify-integrity", INTEGRITY_OK)
+    return (time.perf_counter() - start) * 1000 / n
+
+
+def run_mode(label, commands, n):
+    with tempfile.TemporaryDirectory() as workdir:
+        procs, cold_start = launch(commands, workdir)
+        try:
+            time.sleep(1.0)
+            rss = sum(rss_mb(p.pid) for p in procs)
+            gateway_ms = asyncio.run(time_gateway(n))
+        finally:
+            stop(procs)
+    print(f"{label:<14} cold start {cold_start:6.2f} s   RSS {rss:7.1f} MB   "
+          f"prepare-offline {gateway_ms:6.2f} ms")
+    return gateway_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    n = parser.parse_args().requests
+
+    separate = [
+        [sys.executable, "-m", "uvicorn", f"{name}.main:app", "--port", str(port),
+         "--log-level", "warning"]
+        for name, port, _ in SERVICES
+    ]
+    combined = [[sys.executable, os.path.join(BACKEND_DIR, "run_all.py"), "--log-level", "warning"]]
+
+    separate_ms = run_mode("8 processes", separate, n)
+    combined_ms = run_mode("run_all.py", combined, n)
+    print(f"saved per internal hop (end to end): {(separate_ms - combined_ms) / 3:.2f} ms")
+
+    # Isolated hop: loopback HTTP to a standalone Auth process vs in-process.
+    with tempfile.TemporaryDirectory() as workdir:
+        procs, _ = launch(separate[:1], workdir, ports=[8000])
+        try:
+            http_ms = asyncio.run(time_hop(n))
+        finally:
+            stop(procs)
+    auth = importlib.import_module("auth-service.main")
+    register_local("http://localhost:8000", "/auth/verify-integrity",
+                   lambda body: auth.verify_integrity(auth.IntegrityReport(**body)))
+    local_ms = asyncio.run(time_hop(n))
+    clear_local()
+    print(f"Gateway -> Auth hop: HTTP {http_ms:.3f} ms   in-process {local_ms:.3f} ms   "
+          f"saved {http_ms - local_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,12 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import create_engine, Column, String, Float, Integer
+from sqlalchemy import Column, String, Float, Integer
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from shared.db import LazyDatabase
 from fastapi.middleware.cors import CORSMiddleware
 
 # --- Database Setup (cite: 5) ---
 DATABASE_URL = "sqlite:///./wallets.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 class Wallet(Base):
@@ -18,7 +16,8 @@ class Wallet(Base):
     spendable_balance = Column(Float, default=2450.0)
     escrow_locked = Column(Float, default=0.0)
 
-Base.metadata.create_all(bind=engine)
+# Engine and schema are created on the first session, not at import.
+SessionLocal = LazyDatabase(DATABASE_URL, Base)
 
 app = FastAPI(title="BlueMint - Persistent Wallet Service")
 
@@ -1,10 +1,10 @@
-import httpx
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import os
+from shared.service_client import ServiceSession
 
 app = FastAPI(title="BlueMint - API Gateway & App Host")
 
@@ -40,26 +40,26 @@ async def serve_index():
 # --- 3. EXISTING API LOGIC ---
 @app.post("/gateway/prepare-offline")
 async def prepare_offline_session(request: OfflineStartRequest):
-    async with httpx.AsyncClient() as client:
+    async with ServiceSession() as services:
         # 1. Verify Integrity (cite: 1319)
-        auth_resp = await client.post(f"{AUTH_URL}/auth/verify-integrity", json=request.integrity_report)
-        if auth_resp.json().get("status") != "secure":
+        auth_resp = await services.post_json(AUTH_URL, "/auth/verify-integrity", request.integrity_report)
+        if auth_resp.get("status") != "secure":
             raise HTTPException(status_code=403, detail="Device integrity compromised.")
 
         # 2. Lock Escrow Funds (cite: 530)
-        escrow_resp = await client.post(f"{ESCROW_URL}/wallet/lock-escrow", json={
+        escrow_resp = await services.post_json(ESCROW_URL, "/wallet/lock-escrow", {
             "wallet_id": request.wallet_id,
             "amount_to_lock": request.amount
         })
         
         # 3. Mint Tokens (cite: 743)
-        token_resp = await client.post(f"{TOKEN_URL}/tokens/mint", json={
+        token_resp = await services.post_json(TOKEN_URL, "/tokens/mint", {
             "wallet_id": request.wallet_id,
             "amount": request.amount
         })
         
         return {
             "status": "ready",
-            "tokens": token_resp.json(),
+            "tokens": token_resp,
             "message": "Offline session initialized."
         }
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+BlueMint - Single-process launcher.
+
+Runs all eight services inside one ASGI app instead of eight separate
+`uvicorn ... --reload` processes. FastAPI, SQLAlchemy and pydantic are
+imported once, and Gateway/Settlement calls into Auth, Escrow and Token are
+awaited directly instead of going over localhost HTTP.
+
+Run from the `escrow-backend` root (database paths are relative to it):
+
+    python run_all.py                        # every legacy port, one process
+    python run_all.py --port 8080            # everything on a single port
+
+Every port serves every service's routes and the Gateway-hosted frontend, so
+the existing frontend and test_flow.py work unchanged. Only the docs pages
+(`/docs`, `/redoc`, `/openapi.json`) depend on the port: each legacy port
+shows its own service's docs, and any other port shows the Gateway's.
+
+`--workers N` starts N processes on the same ports, but the Token service's
+in-memory store and the Risk service's limits are per worker, so tokens
+minted by one worker are invisible to the others.
+"""
+import argparse
+import importlib
+import logging
+import multiprocessing
+import signal
+import socket
+import traceback
+from contextlib import AsyncExitStack
+
+import uvicorn
+
+from shared.service_client import register_local
+
+# (service folder, legacy port, URL prefixes it owns; "/" matches only itself)
+SERVICES = [
+    ("auth-service", 8000, ("/auth",)),
+    ("escrow-service", 8001, ("/wallet",)),
+    ("token-service", 8002, ("/tokens",)),
+    ("settlement-service", 8003, ("/settle", "/merchant")),
+    ("transaction-service", 8004, ("/transactions", "/history", "/status")),
+    ("risk-service", 8005, ("/risk",)),
+    ("admin-service", 8006, ("/admin",)),
+    ("gateway-service", 8080, ("/gateway", "/app", "/")),
+]
+LEGACY_PORTS = [port for _, port, _ in SERVICES]
+
+logger = logging.getLogger("run_all")
+
+
+class CombinedApp:
+    """
+    Dispatches each request to the service that owns its path prefix.
+    Paths no service claims (`/docs`, `/openapi.json`, ...) go to the
+    service whose legacy port received the request, falling back to the
+    Gateway for any other port.
+    """
+
+    def __init__(self, services: dict):
+        self.prefixes = [
+            (prefix, services[name].app)
+            for name, _, prefixes in SERVICES
+            for prefix in prefixes
+        ]
+        self.by_port = {port: services[name].app for name, port, _ in SERVICES}
+        self.default = services["gateway-service"].app
+        self.apps = [services[name].app for name, _, _ in SERVICES]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+            return
+        await self._resolve(scope)(scope, receive, send)
+
+    def _resolve(self, scope):
+        path = scope["path"]
+        for prefix, app in self.prefixes:
+            if path == prefix or path.startswith(prefix + "/"):
+                return app
+        server = scope.get("server") or (None, None)
+        return self.by_port.get(server[1], self.default)
+
+    async def _lifespan(self, scope, receive, send):
+        # Run every service's startup/shutdown hooks (on_event or lifespan=)
+        # exactly as Starlette's Router.lifespan would for a single app.
+        started = False
+        await receive()
+        try:
+            async with AsyncExitStack() as stack:
+                for app in self.apps:
+                    state = await stack.enter_async_context(app.router.lifespan_context(app))
+                    if state is not None:
+                        if "state" not in scope:
+                            raise RuntimeError('The server does not support "state" in the lifespan scope.')
+                        scope["state"].update(state)
+                await send({"type": "lifespan.startup.complete"})
+                started = True
+                await receive()
+        except BaseException:
+            failed = "lifespan.shutdown.failed" if started else "lifespan.startup.failed"
+            await send({"type": failed, "message": traceback.format_exc()})
+            raise
+        else:
+            await send({"type": "lifespan.shutdown.complete"})
+
+
+def short_circuit(services: dict):
+    """Serves internal service-to-service calls from this process."""
+    auth = services["auth-service"]
+    escrow = services["escrow-service"]
+    token = services["token-service"]
+    gateway = services["gateway-service"]
+    settlement = services["settlement-service"]
+
+    register_local(gateway.AUTH_URL, "/auth/verify-integrity",
+                   lambda body: auth.verify_integrity(auth.IntegrityReport(**body)))
+    register_local(gateway.ESCROW_URL, "/wallet/lock-escrow",
+                   lambda body: escrow.lock_escrow(escrow.EscrowRequest(**body)))
+    register_local(gateway.TOKEN_URL, "/tokens/mint",
+                   lambda body: token.mint_tokens(token.MintRequest(**body)))
+    register_local(settlement.ESCROW_URL, "/wallet/burn-escrow", escrow.burn_escrow)
+
+
+def build_app():
+    """App factory, also usable as `uvicorn run_all:build_app --factory`."""
+    services = {name: importlib.import_module(f"{name}.main") for name, _, _ in SERVICES}
+    short_circuit(services)
+    return CombinedApp(services)
+
+
+def listen_socket(host: str, port: int) -> socket.socket:
+    # Pass IPPROTO_TCP explicitly: asyncio only enables TCP_NODELAY on
+    # accepted connections whose socket reports proto == TCP, and
+    # uvicorn's own bind_socket() leaves it at 0, which costs ~40 ms per
+    # keep-alive request (Nagle vs. delayed ACK).
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    logger.info("Uvicorn running on http://%s:%d (Press CTRL+C to quit)", host, port)
+    return sock
+
+
+def serve(sockets, log_level: str):
+    config = uvicorn.Config(build_app(), log_level=log_level)
+    try:
+        uvicorn.Server(config).run(sockets=sockets)
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run every BlueMint service in one process.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, action="append",
+                        help="Port to listen on (repeatable). Defaults to every legacy service port.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes sharing the listening sockets.")
+    parser.add_argument("--log-level", default="info",
+                        choices=["critical", "error", "warning", "info", "debug"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s:     %(message)s")
+    sockets = [listen_socket(args.host, port) for port in args.port or LEGACY_PORTS]
+    if args.workers <= 1:
+        serve(sockets, args.log_level)
+        return
+
+    logger.warning(
+        "--workers %d: the Token store and Risk limits live in each worker's "
+        "memory, so tokens minted by one worker are not visible to the others. "
+        "Lock, list and settle flows need a single worker.", args.workers)
+
+    # Every worker accepts on the same sockets; each builds its own app.
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=serve, args=(sockets, args.log_level)) for _ in range(args.workers)]
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # A supervisor signalling the whole process group delivers more
+        # SIGINT/SIGTERMs while we wait; shutdown is already under way.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,19 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List
-from sqlalchemy import create_engine, Column, String, Float, DateTime
+from sqlalchemy import Column, String, Float, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import uuid
+from shared.db import LazyDatabase
 from shared.security import verify_token_signature
+from shared.service_client import ServiceSession
 from sqlalchemy import func
-import httpx # Required for service-to-service communication
+
+ESCROW_URL = "http://localhost:8001"
 
 # --- Database Setup ---
 DATABASE_URL = "sqlite:///./ledger.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 class LedgerEntry(Base):
@@ -28,7 +28,8 @@ class SpentToken(Base):
     __tablename__ = "spent_tokens"
     token_id = Column(String, primary_key=True)
 
-Base.metadata.create_all(bind=engine)
+# Engine and schema are created on the first session, not at import.
+SessionLocal = LazyDatabase(DATABASE_URL, Base)
 
 app = FastAPI(title="BlueMint - Persistent Ledger Service")
 
@@ -97,8 +98,8 @@ async def settle_payment(request: SettlementRequest):
 
     # --- 4. RECONCILIATION: Burn the USER'S LOCKED BALANCE ---
     if issuer_id and total_amount > 0:
-        async with httpx.AsyncClient() as client:
-            await client.post("http://localhost:8001/wallet/burn-escrow", json={
+        async with ServiceSession() as services:
+            await services.post_json(ESCROW_URL, "/wallet/burn-escrow", {
                 "wallet_id": issuer_id,
                 "amount": total_amount
             })
@@ -0,0 +1,31 @@
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+class LazyDatabase:
+    """
+    Drop-in replacement for a module-level `SessionLocal` sessionmaker.
+    The engine and `Base.metadata.create_all` are deferred until the first
+    session is requested, so importing a service (or mounting all of them
+    in one process) never touches the disk.
+    """
+
+    def __init__(self, url: str, base):
+        self.url = url
+        self.base = base
+        self._sessionmaker = None
+        self._lock = threading.Lock()
+
+    def _factory(self):
+        if self._sessionmaker is None:
+            with self._lock:
+                if self._sessionmaker is None:
+                    engine = create_engine(self.url, connect_args={"check_same_thread": False})
+                    self.base.metadata.create_all(bind=engine)
+                    self._sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        return self._sessionmaker
+
+    def __call__(self):
+        return self._factory()()
@@ -0,0 +1,164 @@
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, inspect
+from sqlalchemy.ext.declarative import declarative_base
+
+import run_all
+from shared.db import LazyDatabase
+from shared.service_client import ServiceSession
+
+INTEGRITY_OK = {
+    "device_id": "TEST-DEVICE",
+    "is_rooted": False,
+    "app_signature_valid": True,
+    "has_debugger": False,
+    "is_emulator": False,
+}
+
+
+@pytest.fixture(scope="module")
+def app():
+    return run_all.build_app()
+
+
+def client_on(app, port):
+    # TestClient fills scope["server"] from the base URL's host and port.
+    return TestClient(app, base_url=f"http://testserver:{port}")
+
+
+def service(name):
+    return importlib.import_module(f"{name}.main")
+
+
+def post_json(base_url, path, payload):
+    async def call():
+        async with ServiceSession() as services:
+            body = await services.post_json(base_url, path, payload)
+            assert services._client is None, "call went over HTTP"
+            return body
+    return asyncio.run(call())
+
+
+# --- Dispatch ---
+
+@pytest.mark.parametrize("port", [8000, 8003, 8080, 9999])
+def test_every_port_serves_every_prefix(app, port):
+    client = client_on(app, port)
+    assert client.get("/risk/config").json()["global_escrow_cap"] == 5000.0
+    assert client.get("/admin/audit/REQ-1").json()["payment_request_id"] == "REQ-1"
+    assert client.get("/transactions/WLT-8F3A-92KD").status_code == 200
+    assert client.get("/tokens/metadata/missing").json() == {"detail": "Token not found"}
+    assert client.get("/").headers["content-type"].startswith("text/html")
+    assert client.get("/app/merchant.html").status_code == 200
+
+    resp = client.post("/gateway/prepare-offline", json={
+        "wallet_id": "WLT-TEST", "phone": "0", "amount": 100.0,
+        "integrity_report": dict(INTEGRITY_OK, is_rooted=True),
+    })
+    assert resp.status_code == 403
+    assert resp.json() == {"detail": "Device integrity compromised."}
+
+
+@pytest.mark.parametrize("port, service_name", [
+    (8001, "escrow-service"),
+    (8005, "risk-service"),
+    (8080, "gateway-service"),
+    (9999, "gateway-service"),
+])
+def test_unclaimed_paths_follow_the_port(app, port, service_name):
+    title = client_on(app, port).get("/openapi.json").json()["info"]["title"]
+    assert title == service(service_name).app.title
+
+
+# --- In-process calls ---
+
+@pytest.mark.parametrize("payload", [
+    INTEGRITY_OK,
+    dict(INTEGRITY_OK, has_debugger=True),
+    {"device_id": "TEST-DEVICE", "is_rooted": "maybe"},
+])
+def test_short_circuit_matches_http_body(app, payload):
+    gateway, auth = service("gateway-service"), service("auth-service")
+    over_http = TestClient(auth.app).post("/auth/verify-integrity", json=payload).json()
+    assert post_json(gateway.AUTH_URL, "/auth/verify-integrity", payload) == over_http
+
+
+def test_short_circuit_http_exception_body(app):
+    gateway, token = service("gateway-service"), service("token-service")
+    payload = {"wallet_id": "WLT-TEST", "amount": 0}
+    over_http = TestClient(token.app).post("/tokens/mint", json=payload).json()
+    assert over_http == {"detail": "Amount must be positive"}
+    assert post_json(gateway.TOKEN_URL, "/tokens/mint", payload) == over_http
+
+
+def test_short_circuit_serializes_models(app):
+    gateway = service("gateway-service")
+    tokens = post_json(gateway.TOKEN_URL, "/tokens/mint", {"wallet_id": "WLT-TEST", "amount": 300})
+    assert [t["denomination"] for t in tokens] == [200, 100]
+    assert all(isinstance(t, dict) and t["issuer_wallet_id"] == "WLT-TEST" for t in tokens)
+
+
+# --- Lifespan ---
+
+def test_lifespan_reaches_every_service():
+    events = []
+    services = {}
+    for name, _, _ in run_all.SERVICES:
+        sub = FastAPI()
+        sub.router.on_startup.append(lambda name=name: events.append(("startup", name)))
+        sub.router.on_shutdown.append(lambda name=name: events.append(("shutdown", name)))
+        services[name] = SimpleNamespace(app=sub)
+
+    @asynccontextmanager
+    async def lifespan(_):
+        events.append(("startup", "lifespan"))
+        yield {"ready": True}
+        events.append(("shutdown", "lifespan"))
+
+    risk = FastAPI(lifespan=lifespan)
+
+    @risk.get("/risk/ready")
+    async def ready(request: Request):
+        return request.state.ready
+
+    services["risk-service"].app = risk
+
+    with TestClient(run_all.CombinedApp(services)) as client:
+        assert client.get("/risk/ready").json() is True
+        assert [e for e in events if e[0] == "startup"] == [
+            ("startup", "lifespan" if name == "risk-service" else name)
+            for name, _, _ in run_all.SERVICES
+        ]
+    assert len(events) == 2 * len(run_all.SERVICES)
+
+
+# --- Lazy setup ---
+
+def test_lazy_database_creates_file_on_first_session(tmp_path):
+    Base = declarative_base()
+
+    class Row(Base):
+        __tablename__ = "rows"
+        id = Column(Integer, primary_key=True)
+
+    path = tmp_path / "lazy.db"
+    SessionLocal = LazyDatabase(f"sqlite:///{path}", Base)
+    assert not path.exists()
+
+    db = SessionLocal()
+    assert db.query(Row).count() == 0
+    assert inspect(db.get_bind()).has_table("rows")
+    db.close()
+    assert path.exists()
+
+
+def test_build_app_touches_no_disk(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    run_all.build_app()
+    assert list(tmp_path.iterdir()) == []